@@ -29,42 +29,48 @@ inp_pattern_col = ["0", "1"]
 # - Vertical: Col 1, rows 0-1 = "1 0" ✓
 # - Horizontal: Row 1, cols 0-1 = "0 1" ✓
 inp_map_string = [
-    ["0 1 0 1 "] ,  # Row 0: col 1 = "1" (start of vertical "1 0")
-    ["0 1 1 1 "] ,  # Row 1: col 1 = "0" (end of vertical "1 0"), cols 0-1 = "0 1" ✓
-    ["1 1 0 0 "] ,  # Row 2
-    ["0 1 1 0 "] ,  # Row 3
+    "0 1 0 1 ",  # Row 0: col 1 = "1" (start of vertical "1 0")
+    "0 1 1 1 ",  # Row 1: col 1 = "0" (end of vertical "1 0"), cols 0-1 = "0 1" ✓
+    "1 1 0 0 ",  # Row 2
+    "0 1 1 0 ",  # Row 3
 ]
 
 # Variation 2: Dense map with many matches (commented out)
 # inp_map_string = [
-#     ["1 1 1 1 1 1 "] ,
-#     ["1 1 1 1 1 1 "] ,
-#     ["1 1 1 1 1 1 "] ,
-#     ["1 1 1 1 1 1 "] ,
-#     ["1 1 1 1 1 1 "] ,
-#     ["1 1 1 1 1 1 "] ,
+#     "1 1 1 1 1 1 ",
+#     "1 1 1 1 1 1 ",
+#     "1 1 1 1 1 1 ",
+#     "1 1 1 1 1 1 ",
+#     "1 1 1 1 1 1 ",
+#     "1 1 1 1 1 1 ",
 # ]
 
 # Variation 3: Pattern with clear target location (commented out)
 # inp_map_string = [
-#     ["0 0 0 0 0 0 "] ,
-#     ["0 0 0 0 0 0 "] ,
-#     ["0 0 1 1 0 0 "] ,
-#     ["0 0 1 1 0 0 "] ,
-#     ["0 0 0 0 0 0 "] ,
-#     ["0 0 0 0 0 0 "] ,
+#     "0 0 0 0 0 0 ",
+#     "0 0 0 0 0 0 ",
+#     "0 0 1 1 0 0 ",
+#     "0 0 1 1 0 0 ",
+#     "0 0 0 0 0 0 ",
+#     "0 0 0 0 0 0 ",
 # ]
 
 # Variation 4: Random-like distribution (commented out)
 # inp_map_string = [
-#     ["1 0 1 0 1 0 "] ,
-#     ["0 1 0 1 0 1 "] ,
-#     ["1 0 1 0 1 0 "] ,
-#     ["0 1 0 1 0 1 "] ,
-#     ["1 0 1 0 1 0 "] ,
-#     ["0 1 0 1 0 1 "] ,
+#     "1 0 1 0 1 0 ",
+#     "0 1 0 1 0 1 ",
+#     "1 0 1 0 1 0 ",
+#     "0 1 0 1 0 1 ",
+#     "1 0 1 0 1 0 ",
+#     "0 1 0 1 0 1 ",
 # ]
 
+# Everything derived from the map and patterns (inp_map_bits, inp_map_array,
+# PATTERN_*, REUSE_QUBITS, SEARCH_SPACE, GROVER_ITERATIONS, ...), see utils.py.
+# Cached on disk by content hash, so re-imports skip the parsing
+from utils import load_map_artifacts
+globals().update(load_map_artifacts(inp_map_string, inp_pattern_row, inp_pattern_col))
+
 CONFIG = {
     "TEST_ORACLE": {
         "enable": False, # Used to validate the Oracle
@@ -75,6 +81,6 @@ CONFIG = {
     "AVAILABLE_PROVIDERS": ["IONQ", "IBM", "FAKEIBM", "SIMULATE", "BLUEQUBIT"],
     "SELECTED_PROVIDER": "SIMULATE",
     "USE_JOB_ID": "", # Used to recall results from an external service
-    "REUSE_ROW_COL_QUBITS": inp_pattern_row==inp_pattern_col, # If set to True, Row and Col patterns are the same, so Qubits are reused
+    "REUSE_ROW_COL_QUBITS": REUSE_QUBITS, # If set to True, Row and Col patterns are the same, so Qubits are reused
 }    
     
\ No newline at end of file
@@ -34,10 +34,10 @@ from qiskit.circuit.library import MCXGate
 from qiskit.visualization import plot_histogram
 
 # Import our libraries...
-from utils import show_map, create_map_search, create_positions
+from utils import show_map, create_map_search, create_positions, find_pattern_matches, grover_sizing
 from logs import logger
 from termcolor import colored
-from visualizations import create_comprehensive_visualization, show_enhanced_map, generate_summary_report
+from visualizations import submit_comprehensive_visualization, show_enhanced_map, generate_summary_report, prepare_panel_data
 
 # our Grover libs
 from lib import simulate, checkEqual, initialize_H, XNOR, XOR, toffoli_general, get_qubit_index_list, add_measurement, diffusion, set_inputs
@@ -49,11 +49,11 @@ from lib import execute_on_IONQ, execute_on_QuantumInspire, simulate, execute_on
 
 """
 inp_map_string = [
-    ["0 0 1 1 0 0"] ,
-    ["0 0 0 0 0 0"] ,
-    ["1 0 0 1 0 1"] ,    
-    ["1 1 0 0 0 0"] ,        
-    ["0 0 0 1 0 0"] ,        
+    "0 0 1 1 0 0",
+    "0 0 0 0 0 0",
+    "1 0 0 1 0 1",    
+    "1 1 0 0 0 0",        
+    "0 0 0 1 0 0",        
  
 ]
 
@@ -79,7 +79,7 @@ from conf import *
 
 
 # Some string managing...
-inp_map_string_joined = (  ("".join(["".join(each) for each in inp_map_string])).replace(" ","") )
+inp_map_string_joined = "".join(inp_map_string).replace(" ","")
 inp_pattern_row_joined = "".join(inp_pattern_row)
 inp_pattern_col_joined = "".join(inp_pattern_col)
 
@@ -91,11 +91,11 @@ SEND_TO = CONFIG["SELECTED_PROVIDER"]
 
 
 # Bytes are only written "in horizontal"
-GRID_WIDTH = int(len(inp_map_string[0][0].replace(" ","")) / BYTE_SIZE)
-GRID_HEIGHT = int(len(inp_map_string) )
+GRID_WIDTH = int(len(inp_map_string[0].replace(" ","")) / BYTE_SIZE)
+GRID_HEIGHT = MAP_ROWS
 
 # Join inp_map_string into a single string
-inp_map_string="".join(["".join(item) for column in inp_map_string for item in column]).replace(" ","").replace("X","1")
+inp_map_string="".join(inp_map_string).replace(" ","").replace("X","1")
 
 logger.info("[[ STARTING MAP SEARCH]] @%s" %datetime.datetime.now())
 
@@ -127,11 +127,23 @@ if TEST_ORACLE:
             logger.debug("Looking for pos: %s" %each_position["index"])
             CONFIG["TEST_ORACLE"]["check_pos"]=each_position["index"]
 
+    # Classical answer for that position
+    if CONFIG["TEST_ORACLE"]["check_pos"]!=-1:
+        check_row = CONFIG["TEST_ORACLE"]["check_pos_row"]
+        check_col = CONFIG["TEST_ORACLE"]["check_pos_col"]
+        solutions = find_pattern_matches(inp_map_array, pattern_row_arr, pattern_col_arr)
+        logger.info("Classical solutions (row,col): %s" %solutions)
+        logger.info("Classical check for (%s,%s): expected output=%s" %(check_row, check_col, int((check_row, check_col) in solutions)))
+
 logger.info("Allowed positions: %s" %len(positions))
 
 # Create required registers 
 # Search space size is equal to the length of allowed positions
-num_s_bits =  math.ceil(  math.log2(  len(positions) )    )
+# (sized from the positions actually created: conf's SEARCH_SPACE counts map
+# characters, which differs for multi-bit cells)
+if SEARCH_SPACE != len(positions):
+    logger.warning("conf SEARCH_SPACE (%s) differs from allowed positions (%s), sizing from the positions" %(SEARCH_SPACE, len(positions)))
+grover_iterations, num_s_bits = grover_sizing(len(positions)) # ceil(log2(len(positions))) qubits
 logger.info("Num qubits in search space: %squbits " %(num_s_bits))
 
 search_space=QuantumRegister( num_s_bits , "s")
@@ -223,7 +235,10 @@ logger.info("N: %s, M: %s" %(N, M))
 
 #num_repetitions = 2+math.ceil(math.pi/(4* math.asin(math.sqrt(1/(N/M)))))
 
-num_repetitions = math.ceil(math.pi/(4* math.asin(math.sqrt(1/(N/M)))))
+#num_repetitions = math.ceil(math.pi/(4* math.asin(math.sqrt(1/(N/M)))))
+
+# Same formula (M=1), computed with num_s_bits from len(positions)
+num_repetitions = grover_iterations
 
 # Hack for IBM / IONQ....
 """
@@ -347,31 +362,37 @@ if not TEST_ORACLE: # CALCULATE
 
     # Calculate total shots for reporting
     total_shots = sum(counts.values())
+
+    # Decode, sort and summarize the counts once, shared by the report, map and dashboard
+    panel_data = prepare_panel_data(counts, positions)
+
+    # Start the comprehensive visualization dashboard now; with a non-GUI backend
+    # (e.g. QC_HEADLESS=1) it renders in the background while the report is printed
+    logger.info("Generating comprehensive visualization dashboard...")
+    fig_future = submit_comprehensive_visualization(
+        counts, positions, qc, num_repetitions,
+        inp_map_string, GRID_WIDTH, BYTE_SIZE,
+        selected_row, selected_col, inp_pattern_row,
+        inp_pattern_col, SEND_TO, data=panel_data
+    )
     
     # Generate and display comprehensive summary report
     logger.info("Generating comprehensive summary report...")
     summary_report = generate_summary_report(
         counts, positions, qc, num_repetitions, selected_row, selected_col,
-        inp_pattern_row, inp_pattern_col, SEND_TO, total_shots
+        inp_pattern_row, inp_pattern_col, SEND_TO, total_shots, data=panel_data
     )
     print(summary_report)
     
     # Show enhanced text-based map (use the processed string version)
-    show_enhanced_map(inp_map_string, GRID_WIDTH, BYTE_SIZE, selected_row, selected_col, positions, counts)
+    show_enhanced_map(inp_map_string, GRID_WIDTH, BYTE_SIZE, selected_row, selected_col, positions, counts,
+                      data=panel_data)
     
     # Also show the original simple map for compatibility
     show_map(inp_map_string, GRID_WIDTH, BYTE_SIZE, selected_row, selected_col)
     
-    # Create comprehensive visualization dashboard
-    logger.info("Generating comprehensive visualization dashboard...")
-    fig = create_comprehensive_visualization(
-        counts, positions, qc, num_repetitions,
-        inp_map_string, GRID_WIDTH, BYTE_SIZE,
-        selected_row, selected_col, inp_pattern_row,
-        inp_pattern_col, SEND_TO
-    )
-    
-    # Save the figure
+    # Save the figure (waits for the dashboard if it is still rendering)
+    fig = fig_future.result()
     timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = f"quantum_search_results_{timestamp}.png"
     fig.savefig(filename, dpi=300, bbox_inches='tight')
@@ -19,159 +19,189 @@ Available variations:
 """
 
 import sys
+from collections import namedtuple
+from functools import lru_cache
+
+_I = sys.intern
+
+
+# map: tuple of row strings, or a zero-arg factory returning one
+class Variation(namedtuple("Variation", "pattern_row pattern_col map")):
+    """Sensor patterns plus the map they are searched in (immutable, no __dict__)."""
+    __slots__ = ()
+
+    @property
+    def rows(self):
+        """The map rows, building them if `map` is a factory."""
+        return self.map() if callable(self.map) else self.map
+
+
+def _map(*rows):
+    """Build a frozen map from row strings, interning every row."""
+    return tuple(_I(row) for row in rows)
+
+
+def _pattern(*cells):
+    """Build a frozen sensor pattern, interning every cell."""
+    return tuple(_I(cell) for cell in cells)
+
+
+# Map factories: a map is only built when a variation actually asks for it,
+# and every caller (several variations share a map) gets the same tuple
+@lru_cache(maxsize=None)
+def _sparse_map():
+    return _map(
+        "1 1 0 0 1 0 ",
+        "0 0 1 1 0 1 ",
+        "1 1 0 0 1 1 ",
+        "0 1 1 0 0 0 ",
+        "1 0 0 1 1 0 ",
+        "0 1 0 1 0 1 ",
+    )
+
+
+@lru_cache(maxsize=None)
+def _dense_map():
+    return _map(
+        "1 1 1 1 1 1 ",
+        "1 1 1 1 1 1 ",
+        "1 1 1 1 1 1 ",
+        "1 1 1 1 1 1 ",
+        "1 1 1 1 1 1 ",
+        "1 1 1 1 1 1 ",
+    )
+
+
+@lru_cache(maxsize=None)
+def _target_map():
+    return _map(
+        "0 0 0 0 0 0 ",
+        "0 0 0 0 0 0 ",
+        "0 0 1 1 0 0 ",
+        "0 0 1 1 0 0 ",
+        "0 0 0 0 0 0 ",
+        "0 0 0 0 0 0 ",
+    )
+
+
+@lru_cache(maxsize=None)
+def _checker_map():
+    return _map(
+        "1 0 1 0 1 0 ",
+        "0 1 0 1 0 1 ",
+        "1 0 1 0 1 0 ",
+        "0 1 0 1 0 1 ",
+        "1 0 1 0 1 0 ",
+        "0 1 0 1 0 1 ",
+    )
+
 
 VARIATIONS = {
-    "sparse_6x6": {
-        "pattern_row": ["1", "1", "0", "0"],
-        "pattern_col": ["1", "1", "0", "0"],
-        "map": [
-            ["1 1 0 0 1 0 "],
-            ["0 0 1 1 0 1 "],
-            ["1 1 0 0 1 1 "],
-            ["0 1 1 0 0 0 "],
-            ["1 0 0 1 1 0 "],
-            ["0 1 0 1 0 1 "],
-        ]
-    },
-    "dense_6x6": {
-        "pattern_row": ["1", "1", "0", "0"],
-        "pattern_col": ["1", "1", "0", "0"],
-        "map": [
-            ["1 1 1 1 1 1 "],
-            ["1 1 1 1 1 1 "],
-            ["1 1 1 1 1 1 "],
-            ["1 1 1 1 1 1 "],
-            ["1 1 1 1 1 1 "],
-            ["1 1 1 1 1 1 "],
-        ]
-    },
-    "target_6x6": {
-        "pattern_row": ["1", "1", "0", "0"],
-        "pattern_col": ["1", "1", "0", "0"],
-        "map": [
-            ["0 0 0 0 0 0 "],
-            ["0 0 0 0 0 0 "],
-            ["0 0 1 1 0 0 "],
-            ["0 0 1 1 0 0 "],
-            ["0 0 0 0 0 0 "],
-            ["0 0 0 0 0 0 "],
-        ]
-    },
-    "checkerboard_6x6": {
-        "pattern_row": ["1", "0", "1"],
-        "pattern_col": ["1", "0", "1"],
-        "map": [
-            ["1 0 1 0 1 0 "],
-            ["0 1 0 1 0 1 "],
-            ["1 0 1 0 1 0 "],
-            ["0 1 0 1 0 1 "],
-            ["1 0 1 0 1 0 "],
-            ["0 1 0 1 0 1 "],
-        ]
-    },
-    "small_pattern_6x6": {
-        "pattern_row": ["1", "1"],
-        "pattern_col": ["1", "1"],
-        "map": [
-            ["1 1 0 0 1 0 "],
-            ["0 0 1 1 0 1 "],
-            ["1 1 0 0 1 1 "],
-            ["0 1 1 0 0 0 "],
-            ["1 0 0 1 1 0 "],
-            ["0 1 0 1 0 1 "],
-        ]
-    },
-    "medium_pattern_6x6": {
-        "pattern_row": ["1", "1", "0"],
-        "pattern_col": ["1", "1", "0"],
-        "map": [
-            ["1 1 0 0 1 0 "],
-            ["0 0 1 1 0 1 "],
-            ["1 1 0 0 1 1 "],
-            ["0 1 1 0 0 0 "],
-            ["1 0 0 1 1 0 "],
-            ["0 1 0 1 0 1 "],
-        ]
-    },
-    "asymmetric_6x6": {
-        "pattern_row": ["1", "0", "1"],
-        "pattern_col": ["1", "1", "0"],
-        "map": [
-            ["1 1 0 0 1 0 "],
-            ["0 0 1 1 0 1 "],
-            ["1 1 0 0 1 1 "],
-            ["0 1 1 0 0 0 "],
-            ["1 0 0 1 1 0 "],
-            ["0 1 0 1 0 1 "],
-        ]
-    },
+    "sparse_6x6": Variation(_pattern("1", "1", "0", "0"), _pattern("1", "1", "0", "0"), _sparse_map),
+    "dense_6x6": Variation(_pattern("1", "1", "0", "0"), _pattern("1", "1", "0", "0"), _dense_map),
+    "target_6x6": Variation(_pattern("1", "1", "0", "0"), _pattern("1", "1", "0", "0"), _target_map),
+    "checkerboard_6x6": Variation(_pattern("1", "0", "1"), _pattern("1", "0", "1"), _checker_map),
+    "small_pattern_6x6": Variation(_pattern("1", "1"), _pattern("1", "1"), _sparse_map),
+    "medium_pattern_6x6": Variation(_pattern("1", "1", "0"), _pattern("1", "1", "0"), _sparse_map),
+    "asymmetric_6x6": Variation(_pattern("1", "0", "1"), _pattern("1", "1", "0"), _sparse_map),
 }
 
 
-def generate_conf_file(variation_name):
-    """Generate conf.py content for a given variation."""
-    if variation_name not in VARIATIONS:
-        print(f"Error: Unknown variation '{variation_name}'")
-        print(f"\nAvailable variations: {', '.join(VARIATIONS.keys())}")
-        return None
-    
-    var = VARIATIONS[variation_name]
-    
-    # Format pattern as Python list
-    pattern_row_str = str(var["pattern_row"]).replace("'", '"')
-    pattern_col_str = str(var["pattern_col"]).replace("'", '"')
-    
-    # Format map as Python list
-    map_lines = []
-    for row in var["map"]:
-        map_lines.append(f'    {str(row)},')
-    
-    map_str = "\n".join(map_lines)
-    
-    conf_content = f'''# ROBOT'S SENSORS (horizontal & vertical)
-# Variation: {variation_name}
-inp_pattern_row = {pattern_row_str}
-inp_pattern_col = {pattern_col_str}
+# conf.py skeleton: header (a %-format constant), one line per map row, footer
+_CONF_HEADER = '''# ROBOT'S SENSORS (horizontal & vertical)
+# Variation: %(variation)s
+inp_pattern_row = %(pattern_row)s
+inp_pattern_col = %(pattern_col)s
 
 # THE MAP - 6x6 GRID
 inp_map_string = [
-{map_str}
-]
+'''
+
+# One pattern as a Python list literal; cells only hold 0/1/X, so no escaping is needed
+def _pattern_literal(cells):
+    return "[%s]" % ", ".join(['"%s"' % cell for cell in cells])
 
-CONFIG = {{
-    "TEST_ORACLE": {{
+# One map row; rows only hold 0/1/X and spaces, so no escaping is needed
+_ROW_FMT = '    "{}",\n'.format
+
+_CONF_FOOTER = ''']
+
+# Everything derived from the map and patterns (inp_map_bits, inp_map_array,
+# PATTERN_*, REUSE_QUBITS, SEARCH_SPACE, GROVER_ITERATIONS, ...), see utils.py.
+# Cached on disk by content hash, so re-imports skip the parsing
+from utils import load_map_artifacts
+globals().update(load_map_artifacts(inp_map_string, inp_pattern_row, inp_pattern_col))
+
+CONFIG = {
+    "TEST_ORACLE": {
         "enable": False, # Used to validate the Oracle
         "check_pos_row": 0, # Validate the oracle with this value (check if output=1)
         "check_pos_col": 1
-    }},
+    },
     "MAKE_IT_REAL": True, # Sent it to some provider? (if False: simulate locally)
     "AVAILABLE_PROVIDERS": ["IONQ", "IBM", "FAKEIBM", "SIMULATE", "BLUEQUBIT"],
     "SELECTED_PROVIDER": "SIMULATE",
     "USE_JOB_ID": "", # Used to recall results from an external service
-    "REUSE_ROW_COL_QUBITS": inp_pattern_row==inp_pattern_col, # If set to True, Row and Col patterns are the same, so Qubits are reused
-}}
+    "REUSE_ROW_COL_QUBITS": REUSE_QUBITS, # If set to True, Row and Col patterns are the same, so Qubits are reused
+}
 '''
-    return conf_content
+
+
+def _iter_conf_lines(variation_name, var):
+    """Yield conf.py content for the variation `var`, piece by piece."""
+    yield _CONF_HEADER % {
+        "variation": variation_name,
+        "pattern_row": _pattern_literal(var.pattern_row),
+        "pattern_col": _pattern_literal(var.pattern_col),
+    }
+    yield "".join(map(_ROW_FMT, var.rows))
+    yield _CONF_FOOTER
+
+
+@lru_cache(maxsize=None)
+def generate_conf_file(variation_name):
+    """Generate conf.py content for a given variation (cached per name).
+
+    Raises KeyError for unknown variation names.
+    """
+    return "".join(_iter_conf_lines(variation_name, VARIATIONS[variation_name]))
+
+
+@lru_cache(maxsize=None)
+def _listing():
+    """One line per variation for the help message (built once, on first use)."""
+    return "\n".join(
+        f"  - {name}: pattern={list(var.pattern_row)}, map_size=6x6"
+        for name, var in VARIATIONS.items()
+    )
+
+
+def clear_cache():
+    """Forget every conf.py generated so far (and the variation listing)."""
+    generate_conf_file.cache_clear()
+    _listing.cache_clear()
 
 
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print(__doc__)
-        print("\nAvailable variations:")
-        for name, var in VARIATIONS.items():
-            print(f"  - {name}: pattern={var['pattern_row']}, map_size=6x6")
-        sys.exit(1)
-    
-    variation = sys.argv[1]
-    conf_content = generate_conf_file(variation)
-    
-    if conf_content:
-        # Write to conf.py
-        with open("conf.py", "w") as f:
-            f.write(conf_content)
-        print(f"✓ Successfully updated conf.py with variation: {variation}")
-        print(f"  Pattern row: {VARIATIONS[variation]['pattern_row']}")
-        print(f"  Pattern col: {VARIATIONS[variation]['pattern_col']}")
-        print(f"  Map size: 6x6")
-        print("\nYou can now run: python main.py")
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=f"Available variations:\n{_listing()}",
+    )
+    parser.add_argument("variation", choices=list(VARIATIONS),
+                        help="variation to write into conf.py")
+    args = parser.parse_args()
 
+    var = VARIATIONS[args.variation]
+    # Stream straight into conf.py
+    with open("conf.py", "w", encoding="ascii", newline="\n") as f:
+        f.writelines(_iter_conf_lines(args.variation, var))
+    sys.stdout.write(
+        f"✓ Successfully updated conf.py with variation: {args.variation}\n"
+        f"  Pattern row: {list(var.pattern_row)}\n"
+        f"  Pattern col: {list(var.pattern_col)}\n"
+        f"  Map size: 6x6\n"
+        "\nYou can now run: python main.py\n"
+    )
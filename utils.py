@@ -1,4 +1,5 @@
 import re
+import os
 import math
 from termcolor import colored
 
@@ -121,6 +122,113 @@ def create_positions(map, search_row, inp_pattern_row, search_col, inp_pattern_c
 
 
 
+## Grover iterations and qubits needed to index a search space of N positions (M=1)
+def grover_sizing(N):
+    iterations = math.ceil(math.pi / (4 * math.asin(math.sqrt(1 / N))))
+    num_qubits = max(1, (N - 1).bit_length())
+    return iterations, num_qubits
+
+
+## Everything conf.py derives from the map and patterns (bitmasks, NumPy arrays, Grover sizing)
+def compute_map_artifacts(inp_map_string, inp_pattern_row, inp_pattern_col):
+    import numpy as np
+
+    # Rows as main.py reads them: spaces are optional and X cells count as 1
+    rows = [row.replace(" ", "").replace("X", "1") for row in inp_map_string]
+
+    # inp_map_bits: one int per row (bit c = col c)
+    # inp_map_flat: every cell as a byte (row-major)
+    inp_map_bits = tuple(int(row[::-1], 2) for row in rows)
+    inp_map_flat = bytes(int(c) for row in rows for c in row)
+    MAP_ROWS = len(rows)
+    MAP_COLS = len(rows[0])
+
+    # Pattern lengths, bitmasks (bit i = pattern[i]) and whether row/col qubits can be shared
+    PATTERN_LEN_ROW = len(inp_pattern_row)
+    PATTERN_LEN_COL = len(inp_pattern_col)
+
+    # Allowed positions (as in create_positions), Grover iterations and qubits to index them
+    SEARCH_SPACE = max(1, (MAP_ROWS - PATTERN_LEN_COL + 1) * (MAP_COLS - PATTERN_LEN_ROW + 1))
+    GROVER_ITERATIONS, N_POSITION_QUBITS = grover_sizing(SEARCH_SPACE)
+
+    return {
+        "inp_map_bits": inp_map_bits,
+        "inp_map_flat": inp_map_flat,
+        "MAP_ROWS": MAP_ROWS,
+        "MAP_COLS": MAP_COLS,
+        "inp_map_array": np.frombuffer(inp_map_flat, dtype=np.uint8).reshape(MAP_ROWS, MAP_COLS),
+        "pattern_row_arr": np.fromiter(map(int, inp_pattern_row), dtype=np.uint8),
+        "pattern_col_arr": np.fromiter(map(int, inp_pattern_col), dtype=np.uint8),
+        "PATTERN_LEN_ROW": PATTERN_LEN_ROW,
+        "PATTERN_LEN_COL": PATTERN_LEN_COL,
+        "PATTERN_ROW_BITS": int("".join(reversed(inp_pattern_row)), 2),
+        "PATTERN_COL_BITS": int("".join(reversed(inp_pattern_col)), 2),
+        "REUSE_QUBITS": list(inp_pattern_row) == list(inp_pattern_col),
+        "SEARCH_SPACE": SEARCH_SPACE,
+        "GROVER_ITERATIONS": GROVER_ITERATIONS,
+        "N_POSITION_QUBITS": N_POSITION_QUBITS,
+    }
+
+
+## Same as compute_map_artifacts, but cached on disk keyed by a hash of the inputs,
+## so sweeps that keep re-importing conf.py only parse each map once
+MAP_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "qc_robot_localisation")
+MAP_CACHE_VERSION = 2 # Bump when compute_map_artifacts changes what it returns
+
+def load_map_artifacts(inp_map_string, inp_pattern_row, inp_pattern_col, cache_dir=MAP_CACHE_DIR):
+    import hashlib
+    import pickle
+    import numpy as np
+
+    # NumPy's version is part of the key: ~/.cache is shared between venvs, and arrays
+    # pickled under one NumPy major version may not load under another
+    key_source = repr((MAP_CACHE_VERSION, np.__version__, list(inp_map_string), list(inp_pattern_row), list(inp_pattern_col)))
+    key = hashlib.blake2b(key_source.encode(), digest_size=16).hexdigest()
+    cache_file = os.path.join(cache_dir, "%s.pkl" %key)
+
+    # Anything wrong with the cached file (missing, truncated, written by an
+    # incompatible version...) just means recomputing it
+    try:
+        with open(cache_file, "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        pass
+
+    artifacts = compute_map_artifacts(inp_map_string, inp_pattern_row, inp_pattern_col)
+    # Best effort: write to a temp file and rename, so parallel runs never read half a file
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        temp_file = "%s.%s.tmp" %(cache_file, os.getpid())
+        with open(temp_file, "wb") as f:
+            pickle.dump(artifacts, f, protocol=5)
+        os.replace(temp_file, cache_file)
+    except OSError:
+        pass
+    return artifacts
+
+
+## Classical solutions: every (row, col) center where both patterns match,
+## using the same vertical/horizontal checks as create_positions
+def find_pattern_matches(inp_map_array, pattern_row_arr, pattern_col_arr):
+    import numpy as np
+    from numpy.lib.stride_tricks import sliding_window_view
+
+    grid_height, grid_width = inp_map_array.shape
+    len_row = len(pattern_row_arr)
+    len_col = len(pattern_col_arr)
+
+    # Vertical runs (checked against the col pattern) and horizontal runs (row pattern)
+    col_hits = (sliding_window_view(inp_map_array, len_col, axis=0) == pattern_col_arr).all(axis=-1)
+    row_hits = (sliding_window_view(inp_map_array, len_row, axis=1) == pattern_row_arr).all(axis=-1)
+
+    # Line both up on the top-left corner of each allowed position
+    num_rows = grid_height - len_col + 1
+    num_cols = grid_width - len_row + 1
+    hits = col_hits[:, len_row//2 : len_row//2 + num_cols] & row_hits[len_col//2 : len_col//2 + num_rows, :]
+
+    return [(int(row) + len_col//2, int(col) + len_row//2) for row, col in np.argwhere(hits)]
+
+
 ## Create search map
 
 
@@ -5,177 +5,476 @@ This module provides comprehensive visualizations for the Grover search algorith
 including detailed statistics, probability distributions, and performance metrics.
 """
 
+import io
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+import matplotlib
+if os.environ.get('QC_HEADLESS'):
+    matplotlib.use('Agg')  # no GUI needed: faster, and lets the dashboard render in the background
 import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
+from matplotlib.collections import PolyCollection
 from matplotlib.gridspec import GridSpec
 import numpy as np
 import math
-from textwrap import wrap
-import re
+from functools import lru_cache
+from typing import NamedTuple
 from termcolor import colored
-from qiskit.visualization import plot_histogram
-import seaborn as sns
 
-# Set style for professional plots
+# Numba is optional: when installed, the map decoding is JIT-compiled
 try:
-    plt.style.use('seaborn-v0_8-darkgrid')
-except OSError:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Plot style is applied on first use, so importing this module (e.g. only for
+# the text report) does not pay for seaborn
+_STYLE_CONFIGURED = False
+
+def _configure_style():
+    """Set style for professional plots (once)."""
+    global _STYLE_CONFIGURED
+    if _STYLE_CONFIGURED:
+        return
+    import seaborn as sns
+
     try:
-        plt.style.use('seaborn-darkgrid')
+        plt.style.use('seaborn-v0_8-darkgrid')
     except OSError:
-        plt.style.use('default')
-sns.set_palette("husl")
+        try:
+            plt.style.use('seaborn-darkgrid')
+        except OSError:
+            plt.style.use('default')
+    sns.set_palette("husl")
+    _STYLE_CONFIGURED = True
+
+def _position_arrays(positions):
+    """Row and column of every search position, indexed by position index."""
+    pos_row = np.fromiter((p['row'] for p in positions), np.int32, len(positions))
+    pos_col = np.fromiter((p['col'] for p in positions), np.int32, len(positions))
+    return pos_row, pos_col
+
+def _decode_indices(keys):
+    """Position index of each measured bitstring, same as int(key[::-1], 2) per key."""
+    if len(keys) == 0:
+        return np.zeros(0, np.int64)
+    # One row of ASCII bytes per key; Qiskit keys are little-endian so char j is bit j
+    bits = np.array(keys, dtype=bytes)
+    bits = bits.view(np.uint8).reshape(len(bits), -1) == ord('1')
+    return bits @ (np.int64(1) << np.arange(bits.shape[1], dtype=np.int64))
+
+def _top_k(values, k):
+    """Indices of the k largest values, largest first; ties keep index order, like sorted()."""
+    k = min(k, len(values))
+    if k == 0:
+        return np.zeros(0, np.intp)
+    # O(N) partition to the k-th largest value, then sort only the keys at or above
+    # it (every key tied with it included, so which ties make the cut stays stable)
+    kth = values[np.argpartition(-values, k - 1)[k - 1]]
+    candidates = np.flatnonzero(values >= kth)
+    return candidates[np.argsort(-values[candidates], kind='stable')[:k]]
+
+# Most results any panel or the report lists (the histogram's 15 bars)
+_TOP_K = 15
+
+class PanelData(NamedTuple):
+    """Counts and positions prepared once per figure, shared by every panel and the report."""
+    keys: list               # measured bitstrings, in counts order
+    counts: np.ndarray       # shots per key
+    probs: np.ndarray        # counts / total_shots
+    row_idx: np.ndarray      # search position of each key, -1 if it decodes past the positions
+    col_idx: np.ndarray
+    order: np.ndarray        # indices of the _TOP_K most measured keys, highest count first
+    total_shots: int
+    entropy: float
+    normalized_entropy: float
+    grid_shape: tuple        # (rows, cols) spanned by the search positions
+    rc_to_count: dict        # (row, col) -> shots measured at that search position
+
+    def top(self, k):
+        """Indices of the k (<= _TOP_K) most measured keys, highest count first."""
+        return self.order[:k]
+
+    def label(self, i):
+        """'(row,col)' of key i, or None if it is not a search position."""
+        if self.row_idx[i] < 0:
+            return None
+        return f"({self.row_idx[i]},{self.col_idx[i]})"
+
+    def count_at(self, row, col):
+        """Shots measured at search position (row, col), 0 if it was never measured."""
+        return self.rc_to_count.get((row, col), 0)
+
+def prepare_panel_data(counts, positions):
+    """Build the PanelData for `counts`: one decode, one top-k selection and one statistics pass."""
+    keys = list(counts)
+    values = np.fromiter(counts.values(), np.int64, len(keys))
+    total_shots = int(values.sum())
+    probs = values / total_shots
+
+    # Decode every key to its search position
+    pos_row, pos_col = _position_arrays(positions)
+    pos_idx = _decode_indices(keys)
+    valid = pos_idx < len(positions)
+    row_idx = np.full(len(keys), -1, np.int32)
+    col_idx = np.full(len(keys), -1, np.int32)
+    row_idx[valid] = pos_row[pos_idx[valid]]
+    col_idx[valid] = pos_col[pos_idx[valid]]
+
+    # Shots per search position (summed, should several keys decode to the same one)
+    rc_to_count = {}
+    for row, col, value in zip(row_idx[valid].tolist(), col_idx[valid].tolist(), values[valid].tolist()):
+        rc_to_count[row, col] = rc_to_count.get((row, col), 0) + value
+
+    # Entropy (measure of uncertainty)
+    nonzero = probs[probs > 0]
+    entropy = float(-(nonzero * np.log2(nonzero)).sum())
+    max_entropy = math.log2(len(keys))
+
+    return PanelData(
+        keys=keys,
+        counts=values,
+        probs=probs,
+        row_idx=row_idx,
+        col_idx=col_idx,
+        order=_top_k(values, _TOP_K),
+        total_shots=total_shots,
+        entropy=entropy,
+        normalized_entropy=(entropy / max_entropy) * 100 if max_entropy > 0 else 0,
+        grid_shape=(int(pos_row.max()) + 1, int(pos_col.max()) + 1) if len(positions) else (0, 0),
+        rc_to_count=rc_to_count,
+    )
+
+def _clean_map(inp_map_string):
+    """Map as one string of '0'/'1' chars - handles both string and list formats."""
+    if isinstance(inp_map_string, (list, tuple)):
+        inp_map_string = "".join(["".join(item) for item in inp_map_string])
+    return inp_map_string.replace(" ", "").replace("X", "1")
+
+if njit is not None:
+    @njit(cache=True)
+    def _decode_grid(buf, GRID_HEIGHT, GRID_WIDTH, BYTE_SIZE):
+        """Decode ASCII '0'/'1' bytes into a (GRID_HEIGHT, GRID_WIDTH) grid of BYTE_SIZE-bit cells."""
+        out = np.empty((GRID_HEIGHT, GRID_WIDTH), np.int64)
+        for i in range(GRID_HEIGHT):
+            for j in range(GRID_WIDTH):
+                base = (i * GRID_WIDTH + j) * BYTE_SIZE
+                v = 0
+                for b in range(BYTE_SIZE):
+                    v = (v << 1) | (buf[base + b] - 48)
+                out[i, j] = v
+        return out
+else:
+    def _decode_grid(buf, GRID_HEIGHT, GRID_WIDTH, BYTE_SIZE):
+        """Decode ASCII '0'/'1' bytes into a (GRID_HEIGHT, GRID_WIDTH) grid of BYTE_SIZE-bit cells."""
+        # '0'/'1' -> 0/1 in one vectorized pass; each cell is a big-endian BYTE_SIZE-bit number
+        bits = (buf[:GRID_HEIGHT * GRID_WIDTH * BYTE_SIZE] - ord("0")).astype(np.int64)
+        bits = bits.reshape(GRID_HEIGHT, GRID_WIDTH, BYTE_SIZE)
+        return bits @ (np.int64(1) << np.arange(BYTE_SIZE - 1, -1, -1, dtype=np.int64))
+
+@lru_cache(maxsize=8)
+def _map_grid(map_clean, GRID_WIDTH, BYTE_SIZE):
+    """Decode a cleaned map into a read-only (GRID_HEIGHT, GRID_WIDTH) array of cell values.
+
+    Cached per map, so the dashboard and the text map decode it only once.
+    """
+    cell_bits = max(BYTE_SIZE, 1)
+    GRID_HEIGHT = len(map_clean) // (GRID_WIDTH * cell_bits) if GRID_WIDTH > 0 else 0
+    buf = np.frombuffer(map_clean.encode("ascii"), dtype=np.uint8)
+    grid = _decode_grid(buf, GRID_HEIGHT, GRID_WIDTH, cell_bits)
+    grid.flags.writeable = False
+    return grid
+
+class GroverVisualizer:
+    """
+    The comprehensive dashboard as a figure that can be updated in place.
+
+    The figure, axes and artists are built once. update() shows new results by
+    changing artist data (bar heights, image data, wedge angles, texts) instead of
+    rebuilding the figure, which is what makes repeated calls - parameter sweeps,
+    successive Grover iterations - cheap. The map, positions, patterns and backend
+    are fixed for the lifetime of a visualizer.
+    """
+
+    def __init__(self, counts, positions, qc, num_repetitions,
+                 inp_map_string, GRID_WIDTH, BYTE_SIZE,
+                 selected_row, selected_col, inp_pattern_row,
+                 inp_pattern_col, backend_name="SIMULATE", data=None, dpi=90):
+        _configure_style()
+        self.positions = positions
+        self.qc = qc
+        self.num_repetitions = num_repetitions
+
+        # Optimized size for 13-inch MacBook (2560x1600 or 1280x800)
+        # Using 16:10 aspect ratio that fits well; `dpi` only sets the on-screen
+        # resolution (savefig takes its own), batch runs can drop it to 72
+        fig = plt.figure(figsize=(16, 10), facecolor='white', dpi=dpi)
+        
+        # Create a more compact grid layout with better spacing
+        gs = GridSpec(3, 3, figure=fig, hspace=0.35, wspace=0.35, 
+                      left=0.08, right=0.95, top=0.93, bottom=0.07)
+        
+        # Add subtle background color
+        fig.patch.set_facecolor('#f8f9fa')
+        
+        # Prepare the data every panel works from, once
+        if data is None:
+            data = prepare_panel_data(counts, positions)
+
+        # Panel 1: Enhanced Histogram with Statistics
+        ax1 = fig.add_subplot(gs[0, :2])
+        ax1.set_facecolor('white')
+        self._histogram = create_enhanced_histogram(ax1, data)
+        
+        # Panel 2: Probability Distribution
+        ax2 = fig.add_subplot(gs[0, 2])
+        ax2.set_facecolor('white')
+        self._pie = create_probability_distribution(ax2, data)
+        
+        # Panel 3: Circuit Statistics
+        ax3 = fig.add_subplot(gs[1, 0])
+        ax3.set_facecolor('white')
+        self._circuit = create_circuit_statistics(ax3, qc, num_repetitions, backend_name)
+        
+        # Panel 4: Search Space Analysis
+        ax4 = fig.add_subplot(gs[1, 1])
+        ax4.set_facecolor('white')
+        self._heatmap = create_search_space_analysis(ax4, data, selected_row, selected_col)
+        
+        # Panel 5: Performance Metrics
+        ax5 = fig.add_subplot(gs[1, 2])
+        ax5.set_facecolor('white')
+        self._metrics = create_performance_metrics(ax5, data, num_repetitions)
+        
+        # Panel 6: Enhanced Map Visualization
+        ax6 = fig.add_subplot(gs[2, :])
+        ax6.set_facecolor('white')
+        self._map = create_enhanced_map_visualization(ax6, inp_map_string, GRID_WIDTH, BYTE_SIZE,
+                                                      selected_row, selected_col, inp_pattern_row, 
+                                                      inp_pattern_col, data)
+        
+        # Enhanced title with better styling
+        fig.suptitle('Grover Algorithm: Comprehensive Search Analysis', 
+                     fontsize=18, fontweight='bold', y=0.98,
+                     color='#2c3e50', family='sans-serif')
+        
+        # Add subtle border around the entire figure
+        for ax in [ax1, ax2, ax3, ax4, ax5, ax6]:
+            for spine in ax.spines.values():
+                spine.set_edgecolor('#e0e0e0')
+                spine.set_linewidth(1.5)
+
+        self.fig = fig
+
+    def update(self, counts, selected_row, selected_col, qc=None, num_repetitions=None, data=None):
+        """Show new results on the existing figure and return it.
+
+        `qc` and `num_repetitions` only need to be passed when they changed.
+        """
+        if data is None:
+            data = prepare_panel_data(counts, self.positions)
+        if qc is not None or num_repetitions is not None:
+            self.qc = qc if qc is not None else self.qc
+            self.num_repetitions = num_repetitions if num_repetitions is not None else self.num_repetitions
+            _update_circuit_statistics(self._circuit, self.qc, self.num_repetitions)
+
+        _update_enhanced_histogram(self._histogram, data)
+        _update_probability_distribution(self._pie, data)
+        _update_search_space_analysis(self._heatmap, data, selected_row, selected_col)
+        _update_performance_metrics(self._metrics, data, self.num_repetitions)
+        _update_enhanced_map_visualization(self._map, data, selected_row, selected_col)
+
+        self.fig.canvas.draw_idle()
+        return self.fig
 
 def create_comprehensive_visualization(counts, positions, qc, num_repetitions, 
                                      inp_map_string, GRID_WIDTH, BYTE_SIZE,
                                      selected_row, selected_col, inp_pattern_row, 
-                                     inp_pattern_col, backend_name="SIMULATE"):
+                                     inp_pattern_col, backend_name="SIMULATE", data=None, dpi=90):
     """
     Create a comprehensive multi-panel visualization optimized for 13-inch MacBook screens.
+
+    Returns the figure; keep a GroverVisualizer instead to redraw it with new results.
+    The last few figures are cached: calling again with the same inputs returns the
+    same figure (see clear_visualization_cache).
     """
-    # Optimized size for 13-inch MacBook (2560x1600 or 1280x800)
-    # Using 16:10 aspect ratio that fits well
-    fig = plt.figure(figsize=(16, 10), facecolor='white', dpi=100)
-    
-    # Create a more compact grid layout with better spacing
-    gs = GridSpec(3, 3, figure=fig, hspace=0.35, wspace=0.35, 
-                  left=0.08, right=0.95, top=0.93, bottom=0.07)
-    
-    # Add subtle background color
-    fig.patch.set_facecolor('#f8f9fa')
-    
-    # Calculate statistics
-    total_shots = sum(counts.values())
-    probabilities = {k: v/total_shots for k, v in counts.items()}
-    top_5 = dict(list(sorted(counts.items(), key=lambda x: x[1], reverse=True))[:5])
-    
-    # Panel 1: Enhanced Histogram with Statistics
-    ax1 = fig.add_subplot(gs[0, :2])
-    ax1.set_facecolor('white')
-    create_enhanced_histogram(ax1, counts, positions, total_shots, top_5)
-    
-    # Panel 2: Probability Distribution
-    ax2 = fig.add_subplot(gs[0, 2])
-    ax2.set_facecolor('white')
-    create_probability_distribution(ax2, probabilities, positions)
-    
-    # Panel 3: Circuit Statistics
-    ax3 = fig.add_subplot(gs[1, 0])
-    ax3.set_facecolor('white')
-    create_circuit_statistics(ax3, qc, num_repetitions, backend_name)
-    
-    # Panel 4: Search Space Analysis
-    ax4 = fig.add_subplot(gs[1, 1])
-    ax4.set_facecolor('white')
-    create_search_space_analysis(ax4, positions, counts, selected_row, selected_col)
-    
-    # Panel 5: Performance Metrics
-    ax5 = fig.add_subplot(gs[1, 2])
-    ax5.set_facecolor('white')
-    create_performance_metrics(ax5, counts, positions, num_repetitions, total_shots)
-    
-    # Panel 6: Enhanced Map Visualization
-    ax6 = fig.add_subplot(gs[2, :])
-    ax6.set_facecolor('white')
-    create_enhanced_map_visualization(ax6, inp_map_string, GRID_WIDTH, BYTE_SIZE,
-                                     selected_row, selected_col, inp_pattern_row, 
-                                     inp_pattern_col, positions, counts)
-    
-    # Enhanced title with better styling
-    plt.suptitle('Grover Algorithm: Comprehensive Search Analysis', 
-                 fontsize=18, fontweight='bold', y=0.98,
-                 color='#2c3e50', family='sans-serif')
-    
-    # Add subtle border around the entire figure
-    for ax in [ax1, ax2, ax3, ax4, ax5, ax6]:
-        for spine in ax.spines.values():
-            spine.set_edgecolor('#e0e0e0')
-            spine.set_linewidth(1.5)
-    
+    # qc and positions by identity: the same objects are passed around within a run.
+    # Entries keep both alive (and are checked with `is`), so a later object can't
+    # reuse a cached id and be served another circuit's figure
+    key = (frozenset(counts.items()), selected_row, selected_col, num_repetitions, id(qc),
+           id(positions), _clean_map(inp_map_string), GRID_WIDTH, BYTE_SIZE,
+           tuple(inp_pattern_row), tuple(inp_pattern_col), backend_name, dpi)
+    fig = None
+    with _figure_cache_lock:
+        entry = _figure_cache.get(key)
+        if entry is not None and entry[0] is qc and entry[1] is positions:
+            fig = entry[2]
+            _figure_cache.move_to_end(key)
+    if fig is not None:
+        fig.canvas.draw_idle()
+        return fig
+
+    fig = GroverVisualizer(counts, positions, qc, num_repetitions,
+                           inp_map_string, GRID_WIDTH, BYTE_SIZE,
+                           selected_row, selected_col, inp_pattern_row,
+                           inp_pattern_col, backend_name, data=data, dpi=dpi).fig
+    with _figure_cache_lock:
+        _figure_cache[key] = (qc, positions, fig)
+        if len(_figure_cache) > _FIGURE_CACHE_SIZE:
+            _figure_cache.popitem(last=False)
     return fig
 
-def create_enhanced_histogram(ax, counts, positions, total_shots, top_5):
+# (qc, positions, figure) from create_comprehensive_visualization, least recently used first
+# (locked, since figures may be built on the background worker)
+_FIGURE_CACHE_SIZE = 4
+_figure_cache = OrderedDict()
+_figure_cache_lock = threading.Lock()
+
+def clear_visualization_cache():
+    """Forget every cached figure, so the next create_comprehensive_visualization call rebuilds it."""
+    with _figure_cache_lock:
+        _figure_cache.clear()
+
+# Single worker: figures are built one at a time, off the caller's thread
+_executor = None
+
+def _renders_offscreen():
+    """True when the active backend has no GUI, so figures can be built on another thread."""
+    return matplotlib.get_backend().lower() in ('agg', 'cairo', 'pdf', 'pgf', 'ps', 'svg', 'template')
+
+def submit_comprehensive_visualization(*args, **kwargs):
+    """
+    Build the dashboard in the background; returns a Future whose result() is the figure.
+
+    Takes the same arguments as create_comprehensive_visualization. GUI backends
+    are not thread-safe, so with one of those the figure is built right away and
+    returned in an already-completed Future.
+    """
+    global _executor
+    if _renders_offscreen():
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='qc-visualization')
+        return _executor.submit(create_comprehensive_visualization, *args, **kwargs)
+
+    future = Future()
+    try:
+        future.set_result(create_comprehensive_visualization(*args, **kwargs))
+    except Exception as e:
+        future.set_exception(e)
+    return future
+
+# The panels below each return a dict of their artists, which the matching
+# _update_* function refills with new data (used by GroverVisualizer.update)
+
+def _rect_verts(rects):
+    """Corner vertices of each (x, y, width, height) rectangle."""
+    return [[(x, y), (x + w, y), (x + w, y + h), (x, y + h)] for x, y, w, h in rects]
+
+def _add_rect_collection(ax, rects, visible=True, **style):
+    """Add (x, y, width, height) rectangles to `ax` as a single PolyCollection and return it."""
+    collection = PolyCollection(_rect_verts(rects), closed=True, **style)
+    collection.set_visible(visible)
+    ax.add_collection(collection, autolim=visible)
+    return collection
+
+def _set_rects(collection, rects, visible=True):
+    """Move the rectangles of a collection from _add_rect_collection, or hide them."""
+    collection.set_verts(_rect_verts(rects))
+    collection.set_visible(visible)
+
+# Limit to top 15 for better readability on smaller screens
+_HISTOGRAM_LIMIT = _TOP_K
+
+def create_enhanced_histogram(ax, data):
     """Create an enhanced histogram with detailed statistics - optimized for 13-inch display."""
-    # Prepare data - limit to top 15 for better readability on smaller screens
-    sorted_counts = sorted(counts.items(), key=lambda x: x[1], reverse=True)
-    display_limit = min(15, len(sorted_counts))
-    
-    position_indices = []
-    position_labels = []
-    count_values = []
-    
-    for key, value in sorted_counts[:display_limit]:
-        pos_idx = int(key[::-1], 2)
-        if pos_idx < len(positions):
-            pos = positions[pos_idx]
-            position_indices.append(pos_idx)
-            position_labels.append(f"({pos['row']},{pos['col']})")
-            count_values.append(value)
-    
-    # Create bar plot with enhanced colors
+    # One bar (and value label) per display slot; unused slots are hidden
     colors = ['#27ae60' if i == 0 else '#3498db' if i < 3 else '#95a5a6' 
-              for i in range(len(count_values))]
-    bars = ax.bar(range(len(count_values)), count_values, color=colors, 
+              for i in range(_HISTOGRAM_LIMIT)]
+    bars = ax.bar(range(_HISTOGRAM_LIMIT), np.zeros(_HISTOGRAM_LIMIT), color=colors, 
                   alpha=0.85, edgecolor='#34495e', linewidth=1.2, zorder=3)
     
-    # Add value labels on bars (smaller font for compact display)
-    for i, (bar, val) in enumerate(zip(bars, count_values)):
-        height = bar.get_height()
-        prob = (val / total_shots) * 100
-        # Only show percentage if bar is tall enough
-        if height > max(count_values) * 0.1:
-            ax.text(bar.get_x() + bar.get_width()/2., height + max(count_values)*0.01,
-                    f'{val}\n({prob:.1f}%)',
-                    ha='center', va='bottom', fontsize=8, fontweight='bold', color='#2c3e50')
+    # Value labels on bars (smaller font for compact display)
+    value_labels = [ax.text(0, 0, '', ha='center', va='bottom', fontsize=8,
+                            fontweight='bold', color='#2c3e50') for bar in bars]
     
     # Customize axes with better styling
     ax.set_xlabel('Position Index (Row, Col)', fontsize=11, fontweight='bold', color='#2c3e50')
     ax.set_ylabel('Measurement Count', fontsize=11, fontweight='bold', color='#2c3e50')
-    ax.set_title(f'Measurement Results Distribution\n(Total Shots: {total_shots:,})', 
-                 fontsize=12, fontweight='bold', color='#2c3e50', pad=10)
-    ax.set_xticks(range(len(position_labels)))
-    ax.set_xticklabels(position_labels, rotation=45, ha='right', fontsize=9)
     ax.grid(True, alpha=0.25, axis='y', linestyle='--', linewidth=0.8, color='#bdc3c7')
     ax.set_axisbelow(True)
     
     # Enhanced statistics text box
-    top_key = list(top_5.keys())[0]
-    top_prob = (top_5[top_key] / total_shots) * 100
-    stats_text = f'Top Result: {top_5[top_key]} ({top_prob:.2f}%)\n'
-    stats_text += f'Top 3: {sum(list(top_5.values())[:3])} ({sum([(v/total_shots)*100 for v in list(top_5.values())[:3]]):.2f}%)\n'
-    stats_text += f'Unique: {len(counts)}'
-    ax.text(0.02, 0.98, stats_text, transform=ax.transAxes,
-            fontsize=9, verticalalignment='top', color='#2c3e50',
-            bbox=dict(boxstyle='round,pad=0.5', facecolor='#fff9e6', 
-                     edgecolor='#f39c12', alpha=0.9, linewidth=1.5))
-
-def create_probability_distribution(ax, probabilities, positions):
-    """Create a probability distribution pie chart - optimized for 13-inch display."""
-    sorted_probs = sorted(probabilities.items(), key=lambda x: x[1], reverse=True)
-    top_5_probs = dict(sorted_probs[:5])
-    other_prob = sum([v for k, v in sorted_probs[5:]])
+    stats_box = ax.text(0.02, 0.98, '', transform=ax.transAxes,
+                        fontsize=9, verticalalignment='top', color='#2c3e50',
+                        bbox=dict(boxstyle='round,pad=0.5', facecolor='#fff9e6', 
+                                  edgecolor='#f39c12', alpha=0.9, linewidth=1.5))
+
+    artists = {'ax': ax, 'bars': bars, 'value_labels': value_labels, 'stats_box': stats_box}
+    _update_enhanced_histogram(artists, data)
+    return artists
+
+def _update_enhanced_histogram(artists, data):
+    """Fill the histogram artists with `data`."""
+    ax = artists['ax']
+    total_shots = data.total_shots
+
+    shown = [i for i in data.top(_HISTOGRAM_LIMIT).tolist() if data.row_idx[i] >= 0]
+    position_labels = [data.label(i) for i in shown]
+    count_values = data.counts[shown].tolist()
+    peak = max(count_values, default=0)
+
+    for i, (bar, value_label) in enumerate(zip(artists['bars'], artists['value_labels'])):
+        if i >= len(count_values):
+            bar.set_visible(False)
+            value_label.set_visible(False)
+            continue
+        val = count_values[i]
+        prob = (val / total_shots) * 100
+        bar.set_visible(True)
+        bar.set_height(val)
+        # Only show percentage if bar is tall enough
+        value_label.set_visible(val > peak * 0.1)
+        value_label.set_position((bar.get_x() + bar.get_width()/2., val + peak*0.01))
+        value_label.set_text(f'{val}\n({prob:.1f}%)')
     
-    if other_prob > 0:
-        top_5_probs['Others'] = other_prob
-    
-    labels = []
-    for key in top_5_probs.keys():
-        if key != 'Others':
-            pos_idx = int(key[::-1], 2)
-            if pos_idx < len(positions):
-                pos = positions[pos_idx]
-                labels.append(f"({pos['row']},{pos['col']})")
-            else:
-                labels.append(key)
-        else:
-            labels.append('Others')
+    ax.set_title(f'Measurement Results Distribution\n(Total Shots: {total_shots:,})', 
+                 fontsize=12, fontweight='bold', color='#2c3e50', pad=10)
+    ax.set_xticks(range(len(position_labels)))
+    ax.set_xticklabels(position_labels, rotation=45, ha='right', fontsize=9)
     
-    # Enhanced color scheme
-    colors = ['#e74c3c', '#3498db', '#2ecc71', '#f39c12', '#9b59b6', '#95a5a6']
-    colors = colors[:len(top_5_probs)]
+    top_count = int(data.counts[data.top(1)].sum())
+    top3_count = int(data.counts[data.top(3)].sum())
+    top_prob = (top_count / total_shots) * 100
+    top3_prob = (top3_count / total_shots) * 100
+    stats_text = f'Top Result: {top_count} ({top_prob:.2f}%)\n'
+    stats_text += f'Top 3: {top3_count} ({top3_prob:.2f}%)\n'
+    stats_text += f'Unique: {len(data.keys)}'
+    artists['stats_box'].set_text(stats_text)
+
+    # Scale to the bars in use
+    ax.relim(visible_only=True)
+    ax.autoscale_view()
+
+# Enhanced color scheme
+_PIE_COLORS = ['#e74c3c', '#3498db', '#2ecc71', '#f39c12', '#9b59b6', '#95a5a6']
+
+def _pie_slices(data):
+    """Probabilities and labels of the top 5 results, plus 'Others' for the rest."""
+    top_5 = data.top(5)
+    top_5_probs = data.probs[top_5].tolist()
+    other_prob = (data.total_shots - data.counts[top_5].sum()) / data.total_shots
+    labels = [data.label(i) or data.keys[i] for i in top_5.tolist()]
     
-    wedges, texts, autotexts = ax.pie(top_5_probs.values(), labels=labels, 
-                                       autopct='%1.1f%%', colors=colors,
+    if other_prob > 0:
+        top_5_probs.append(other_prob)
+        labels.append('Others')
+    return top_5_probs, labels
+
+def _draw_pie(ax, top_5_probs, labels):
+    """Draw the styled pie; returns ax.pie's (wedges, texts, autotexts)."""
+    wedges, texts, autotexts = ax.pie(top_5_probs, labels=labels, 
+                                       autopct='%1.1f%%', colors=_PIE_COLORS[:len(top_5_probs)],
                                        startangle=90, textprops={'fontsize': 9},
                                        wedgeprops={'edgecolor': 'white', 'linewidth': 2})
     
@@ -188,32 +487,55 @@ def create_probability_distribution(ax, probabilities, positions):
         text.set_fontsize(9)
         text.set_color('#2c3e50')
         text.set_fontweight('bold')
+    return wedges, texts, autotexts
+
+def create_probability_distribution(ax, data):
+    """Create a probability distribution pie chart - optimized for 13-inch display."""
+    wedges, texts, autotexts = _draw_pie(ax, *_pie_slices(data))
     
     ax.set_title('Probability Distribution\n(Top 5 Results)', 
                  fontsize=12, fontweight='bold', color='#2c3e50', pad=10)
+    return {'ax': ax, 'wedges': wedges, 'texts': texts, 'autotexts': autotexts}
+
+def _update_probability_distribution(artists, data):
+    """Move the pie wedges and labels to `data` (the pie is only redrawn if the slice count changes)."""
+    top_5_probs, labels = _pie_slices(data)
+    if len(top_5_probs) != len(artists['wedges']):
+        for artist in artists['wedges'] + artists['texts'] + artists['autotexts']:
+            artist.remove()
+        artists['wedges'], artists['texts'], artists['autotexts'] = _draw_pie(artists['ax'], top_5_probs, labels)
+        return
+
+    # Same layout as ax.pie: counter-clockwise from 90 degrees, labels at 1.1 and
+    # percentages at 0.6 of the radius
+    fracs = np.asarray(top_5_probs) / np.sum(top_5_probs)
+    theta1 = 90 / 360
+    for wedge, text, autotext, frac, label in zip(artists['wedges'], artists['texts'],
+                                                  artists['autotexts'], fracs, labels):
+        theta2 = theta1 + frac
+        wedge.set_theta1(360 * theta1)
+        wedge.set_theta2(360 * theta2)
+        x, y = np.cos(np.pi * (theta1 + theta2)), np.sin(np.pi * (theta1 + theta2))
+        text.set_position((1.1 * x, 1.1 * y))
+        text.set_horizontalalignment('left' if x > 0 else 'right')
+        text.set_text(label)
+        autotext.set_position((0.6 * x, 0.6 * y))
+        autotext.set_text(f'{100 * frac:1.1f}%')
+        theta1 = theta2
+
+_CIRCUIT_STATS = ['Qubits', 'Depth', 'Size', 'Repetitions']
 
 def create_circuit_statistics(ax, qc, num_repetitions, backend_name):
     """Create a visualization of circuit statistics - optimized for 13-inch display."""
-    stats_data = {
-        'Qubits': qc.num_qubits,
-        'Depth': qc.depth(),
-        'Size': qc.size(),
-        'Repetitions': num_repetitions
-    }
-    
-    categories = list(stats_data.keys())
-    values = list(stats_data.values())
     colors_bar = ['#e74c3c', '#3498db', '#2ecc71', '#f39c12']
     
-    bars = ax.barh(categories, values, color=colors_bar, alpha=0.85, 
+    bars = ax.barh(_CIRCUIT_STATS, np.zeros(len(_CIRCUIT_STATS)), color=colors_bar, alpha=0.85, 
                    edgecolor='#34495e', linewidth=1.2, zorder=3)
     
-    # Add value labels with better formatting
-    for i, (bar, val) in enumerate(zip(bars, values)):
-        width = bar.get_width()
-        ax.text(width + max(values)*0.02, bar.get_y() + bar.get_height()/2,
-                f'{val:,}',
-                ha='left', va='center', fontsize=10, fontweight='bold', color='#2c3e50')
+    # Value labels with better formatting
+    value_labels = [ax.text(0, bar.get_y() + bar.get_height()/2, '',
+                            ha='left', va='center', fontsize=10, fontweight='bold', color='#2c3e50')
+                    for bar in bars]
     
     ax.set_xlabel('Value', fontsize=10, fontweight='bold', color='#2c3e50')
     ax.set_title(f'Circuit Statistics\n(Backend: {backend_name})', 
@@ -222,45 +544,49 @@ def create_circuit_statistics(ax, qc, num_repetitions, backend_name):
     ax.set_axisbelow(True)
     ax.tick_params(colors='#2c3e50', labelsize=9)
 
-def create_search_space_analysis(ax, positions, counts, selected_row, selected_col):
+    artists = {'ax': ax, 'bars': bars, 'value_labels': value_labels}
+    _update_circuit_statistics(artists, qc, num_repetitions)
+    return artists
+
+def _update_circuit_statistics(artists, qc, num_repetitions):
+    """Fill the circuit statistics bars for `qc`."""
+    values = [qc.num_qubits, qc.depth(), qc.size(), num_repetitions]
+    for bar, value_label, val in zip(artists['bars'], artists['value_labels'], values):
+        bar.set_width(val)
+        value_label.set_x(val + max(values)*0.02)
+        value_label.set_text(f'{val:,}')
+    artists['ax'].relim()
+    artists['ax'].autoscale_view()
+
+def _search_space_grid(data):
+    """Counts and probabilities (%) per search position, as grids."""
+    # Scatter every key's count onto its position
+    grid = np.zeros(data.grid_shape)
+    valid = data.row_idx >= 0
+    np.add.at(grid, (data.row_idx[valid], data.col_idx[valid]), data.counts[valid])
+    return grid, grid / data.total_shots * 100
+
+def create_search_space_analysis(ax, data, selected_row, selected_col):
     """Create a visualization of the search space - optimized for 13-inch display."""
-    # Create a grid representation
-    max_row = max([p['row'] for p in positions])
-    max_col = max([p['col'] for p in positions])
-    
-    grid = np.zeros((max_row + 1, max_col + 1))
-    prob_grid = np.zeros((max_row + 1, max_col + 1))
-    
-    total_shots = sum(counts.values())
-    
-    for key, value in counts.items():
-        pos_idx = int(key[::-1], 2)
-        if pos_idx < len(positions):
-            pos = positions[pos_idx]
-            grid[pos['row'], pos['col']] = value
-            prob_grid[pos['row'], pos['col']] = (value / total_shots) * 100
-    
-    # Enhanced colormap
-    im = ax.imshow(prob_grid, cmap='YlOrRd', aspect='auto', interpolation='nearest', vmin=0)
-    
-    # Add text annotations with better readability
-    for i in range(max_row + 1):
-        for j in range(max_col + 1):
-            if grid[i, j] > 0:
-                prob_val = prob_grid[i, j]
-                # Better text color selection based on background
-                text_color = 'white' if prob_val > 30 else '#2c3e50'
-                # Smaller font for compact display
-                ax.text(j, i, f'{int(grid[i, j])}\n({prob_val:.1f}%)',
-                       ha='center', va='center', color=text_color,
-                       fontsize=8, fontweight='bold')
+    grid, prob_grid = _search_space_grid(data)
+    max_row, max_col = grid.shape[0] - 1, grid.shape[1] - 1
+    
+    # Enhanced colormap (rasterized: vector outputs embed the cells as one image)
+    im = ax.imshow(prob_grid, cmap='YlOrRd', aspect='auto', interpolation='nearest', vmin=0,
+                   rasterized=True)
+    
+    # One text annotation per cell, shown for cells that were measured
+    cell_labels = np.empty(grid.shape, dtype=object)
+    for i, j in np.ndindex(grid.shape):
+        # Smaller font for compact display
+        cell_labels[i, j] = ax.text(j, i, '', ha='center', va='center',
+                                    fontsize=8, fontweight='bold')
     
     # Enhanced highlight for selected position
-    if selected_row >= 0 and selected_col >= 0:
-        rect = mpatches.Rectangle((selected_col - 0.5, selected_row - 0.5), 
-                                 1, 1, linewidth=3, edgecolor='#00d4ff', 
-                                 facecolor='none', linestyle='--', zorder=10)
-        ax.add_patch(rect)
+    visible = selected_row >= 0 and selected_col >= 0
+    selection = _add_rect_collection(ax, [(selected_col - 0.5, selected_row - 0.5, 1, 1)], visible,
+                                     linewidths=3, edgecolors='#00d4ff', facecolors='none',
+                                     linestyles='--', zorder=10)
     
     ax.set_xlabel('Column', fontsize=10, fontweight='bold', color='#2c3e50')
     ax.set_ylabel('Row', fontsize=10, fontweight='bold', color='#2c3e50')
@@ -271,121 +597,123 @@ def create_search_space_analysis(ax, positions, counts, selected_row, selected_c
     ax.tick_params(colors='#2c3e50', labelsize=9)
     
     # Enhanced colorbar
-    cbar = plt.colorbar(im, ax=ax, label='Probability (%)', shrink=0.8)
+    cbar = ax.figure.colorbar(im, ax=ax, label='Probability (%)', shrink=0.8)
     cbar.set_label('Probability (%)', fontsize=9, fontweight='bold', color='#2c3e50')
     cbar.ax.tick_params(colors='#2c3e50', labelsize=8)
 
-def create_performance_metrics(ax, counts, positions, num_repetitions, total_shots):
+    artists = {'ax': ax, 'image': im, 'cell_labels': cell_labels, 'selection': selection}
+    _update_search_space_analysis(artists, data, selected_row, selected_col, grids=(grid, prob_grid))
+    return artists
+
+def _update_search_space_analysis(artists, data, selected_row, selected_col, grids=None):
+    """Fill the heatmap, its cell annotations and the selection box with `data`."""
+    grid, prob_grid = grids if grids is not None else _search_space_grid(data)
+    artists['image'].set_data(prob_grid)
+    artists['image'].set_clim(0, prob_grid.max())
+
+    for (i, j), cell_label in np.ndenumerate(artists['cell_labels']):
+        if grid[i, j] > 0:
+            prob_val = prob_grid[i, j]
+            # Better text color selection based on background
+            cell_label.set_color('white' if prob_val > 30 else '#2c3e50')
+            cell_label.set_text(f'{int(grid[i, j])}\n({prob_val:.1f}%)')
+            cell_label.set_visible(True)
+        else:
+            cell_label.set_visible(False)
+
+    _set_rects(artists['selection'], [(selected_col - 0.5, selected_row - 0.5, 1, 1)],
+               selected_row >= 0 and selected_col >= 0)
+
+# Bar order of the performance metrics panel
+_METRIC_LABELS = ['Success\nRate', 'Top\nResult', 'Confidence', 'Certainty']
+
+def create_performance_metrics(ax, data, num_repetitions):
     """Create performance metrics visualization - optimized for 13-inch display."""
-    # Calculate metrics
-    top_result_count = max(counts.values())
-    top_result_prob = (top_result_count / total_shots) * 100
-    success_rate = top_result_prob
-    confidence = (top_result_count / total_shots) * 100
-    
-    # Calculate entropy (measure of uncertainty)
-    probabilities = [v/total_shots for v in counts.values()]
-    entropy = -sum([p * math.log2(p) if p > 0 else 0 for p in probabilities])
-    max_entropy = math.log2(len(counts))
-    normalized_entropy = (entropy / max_entropy) * 100 if max_entropy > 0 else 0
-    
-    metrics = {
-        'Success\nRate': success_rate,
-        'Top\nResult': top_result_prob,
-        'Confidence': confidence,
-        'Certainty': 100 - normalized_entropy
-    }
-    
-    categories = list(metrics.keys())
-    values = list(metrics.values())
     colors_metric = ['#27ae60', '#2980b9', '#8e44ad', '#e67e22']
     
-    bars = ax.bar(categories, values, color=colors_metric, alpha=0.85, 
+    bars = ax.bar(_METRIC_LABELS, np.zeros(len(_METRIC_LABELS)), color=colors_metric, alpha=0.85, 
                   edgecolor='#34495e', linewidth=1.2, zorder=3)
     
-    # Add value labels
-    for bar, val in zip(bars, values):
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height + 2,
-                f'{val:.1f}%',
-                ha='center', va='bottom', fontsize=9, fontweight='bold', color='#2c3e50')
+    # Value labels
+    value_labels = [ax.text(bar.get_x() + bar.get_width()/2., 0, '',
+                            ha='center', va='bottom', fontsize=9, fontweight='bold', color='#2c3e50')
+                    for bar in bars]
     
     ax.set_ylabel('Percentage (%)', fontsize=10, fontweight='bold', color='#2c3e50')
-    ax.set_title(f'Performance Metrics\n(Repetitions: {num_repetitions})', 
-                 fontsize=12, fontweight='bold', color='#2c3e50', pad=10)
     ax.set_ylim([0, 105])
     ax.grid(True, alpha=0.25, axis='y', linestyle='--', linewidth=0.8, color='#bdc3c7')
     ax.set_axisbelow(True)
     ax.tick_params(colors='#2c3e50', labelsize=9)
-    plt.xticks(rotation=0, ha='center')
+    plt.setp(ax.get_xticklabels(), rotation=0, ha='center')
+
+    artists = {'ax': ax, 'bars': bars, 'value_labels': value_labels}
+    _update_performance_metrics(artists, data, num_repetitions)
+    return artists
+
+def _update_performance_metrics(artists, data, num_repetitions):
+    """Fill the performance metric bars with `data`."""
+    total_shots = data.total_shots
+
+    # Calculate metrics
+    top_result_count = int(data.counts[data.top(1)].sum())
+    top_result_prob = (top_result_count / total_shots) * 100
+    success_rate = top_result_prob
+    confidence = (top_result_count / total_shots) * 100
+    
+    # Entropy (measure of uncertainty)
+    normalized_entropy = data.normalized_entropy
+    
+    values = [success_rate, top_result_prob, confidence, 100 - normalized_entropy]
+    for bar, value_label, val in zip(artists['bars'], artists['value_labels'], values):
+        bar.set_height(val)
+        value_label.set_y(val + 2)
+        value_label.set_text(f'{val:.1f}%')
+    
+    artists['ax'].set_title(f'Performance Metrics\n(Repetitions: {num_repetitions})', 
+                            fontsize=12, fontweight='bold', color='#2c3e50', pad=10)
 
 def create_enhanced_map_visualization(ax, inp_map_string, GRID_WIDTH, BYTE_SIZE,
                                      selected_row, selected_col, inp_pattern_row,
-                                     inp_pattern_col, positions, counts):
+                                     inp_pattern_col, data):
     """Create an enhanced map visualization with pattern highlighting."""
-    # Parse map string - handle both string and list formats
-    if isinstance(inp_map_string, list):
-        map_clean = "".join(["".join(item) for item in inp_map_string]).replace(" ", "").replace("X", "1")
-    else:
-        map_clean = inp_map_string.replace(" ", "").replace("X", "1")
-    
-    # Calculate grid height
-    if BYTE_SIZE > 0:
-        GRID_HEIGHT = len(map_clean) // (GRID_WIDTH * BYTE_SIZE)
-    else:
-        GRID_HEIGHT = len(map_clean) // GRID_WIDTH if GRID_WIDTH > 0 else 1
-    
-    # Create grid
-    grid = np.zeros((GRID_HEIGHT, GRID_WIDTH))
-    for i in range(GRID_HEIGHT):
-        for j in range(GRID_WIDTH):
-            idx = i * GRID_WIDTH * BYTE_SIZE + j * BYTE_SIZE
-            if idx < len(map_clean):
-                val = map_clean[idx:idx+BYTE_SIZE]
-                grid[i, j] = int(val, 2) if val else 0
-    
-    # Create heatmap
+    # Decode the map into a (GRID_HEIGHT, GRID_WIDTH) grid of cell values (cached per map)
+    grid = _map_grid(_clean_map(inp_map_string), GRID_WIDTH, BYTE_SIZE)
+    GRID_HEIGHT = grid.shape[0]
+    
+    # Create heatmap - a single QuadMesh whose cell edges double as the grid lines
     cmap = plt.cm.RdYlGn
-    im = ax.imshow(grid, cmap=cmap, aspect='auto', vmin=0, vmax=1, 
-                   interpolation='nearest', alpha=0.7)
-    
-    # Add grid lines
-    for i in range(GRID_HEIGHT + 1):
-        ax.axhline(i - 0.5, color='black', linewidth=0.5)
-    for j in range(GRID_WIDTH + 1):
-        ax.axvline(j - 0.5, color='black', linewidth=0.5)
-    
-    # Add cell values (optimized font size for 13-inch)
-    for i in range(GRID_HEIGHT):
-        for j in range(GRID_WIDTH):
-            val = int(map_clean[i * GRID_WIDTH * BYTE_SIZE + j * BYTE_SIZE:
-                               i * GRID_WIDTH * BYTE_SIZE + j * BYTE_SIZE + BYTE_SIZE], 2) if BYTE_SIZE > 0 else int(map_clean[i * GRID_WIDTH + j])
-            text_color = 'white' if grid[i, j] == 1 else 'black'
-            ax.text(j, i, str(val), ha='center', va='center',
-                   color=text_color, fontsize=11, fontweight='bold')
-    
-    # Highlight selected position
-    if selected_row >= 0 and selected_col >= 0:
-        # Highlight the pattern area
-        pattern_row_len = len(inp_pattern_row)
-        pattern_col_len = len(inp_pattern_col)
-        
-        # Draw pattern bounding box (enhanced styling)
-        rect = mpatches.Rectangle((selected_col - pattern_row_len/2 - 0.5, 
-                                   selected_row - pattern_col_len/2 - 0.5),
-                                 pattern_row_len, pattern_col_len,
-                                 linewidth=3.5, edgecolor='#00d4ff', 
-                                 facecolor='none', linestyle='--', alpha=0.9, zorder=10)
-        ax.add_patch(rect)
-        
-        # Add annotation (optimized for 13-inch)
-        ax.annotate('FOUND PATTERN', 
-                   xy=(selected_col, selected_row),
-                   xytext=(selected_col + 2, selected_row - 2),
-                   arrowprops=dict(arrowstyle='->', color='#00d4ff', lw=2.5),
-                   fontsize=10, fontweight='bold', color='#00d4ff',
-                   bbox=dict(boxstyle='round,pad=0.5', facecolor='#fff9e6', 
-                            edgecolor='#f39c12', alpha=0.9, linewidth=2))
+    im = ax.pcolormesh(np.arange(GRID_WIDTH + 1) - 0.5, np.arange(GRID_HEIGHT + 1) - 0.5, grid,
+                       cmap=cmap, vmin=0, vmax=1, edgecolors='black', linewidth=0.5, alpha=0.7,
+                       rasterized=True)
+    ax.invert_yaxis()  # row 0 on top, like imshow
+    ax.grid(False)
+    
+    # Add cell values (optimized font size for 13-inch); grid already holds the
+    # decoded cell values, so labels and colors come straight from it
+    labels = grid.astype(str)
+    text_colors = np.where(grid == 1, 'white', 'black')
+    for (i, j), label in np.ndenumerate(labels):
+        ax.text(j, i, label, ha='center', va='center',
+               color=text_colors[i, j], fontsize=11, fontweight='bold')
+    
+    # Highlight selected position: pattern bounding box (enhanced styling)
+    visible = selected_row >= 0 and selected_col >= 0
+    pattern_row_len = len(inp_pattern_row)
+    pattern_col_len = len(inp_pattern_col)
+    pattern_box = _add_rect_collection(ax, [(selected_col - pattern_row_len/2 - 0.5,
+                                             selected_row - pattern_col_len/2 - 0.5,
+                                             pattern_row_len, pattern_col_len)], visible,
+                                       linewidths=3.5, edgecolors='#00d4ff', facecolors='none',
+                                       linestyles='--', alpha=0.9, zorder=10)
+    
+    # Add annotation (optimized for 13-inch)
+    annotation = ax.annotate('FOUND PATTERN', 
+                             xy=(selected_col, selected_row),
+                             xytext=(selected_col + 2, selected_row - 2),
+                             arrowprops=dict(arrowstyle='->', color='#00d4ff', lw=2.5),
+                             fontsize=10, fontweight='bold', color='#00d4ff',
+                             bbox=dict(boxstyle='round,pad=0.5', facecolor='#fff9e6', 
+                                       edgecolor='#f39c12', alpha=0.9, linewidth=2))
     
     # Add pattern information (optimized for 13-inch)
     pattern_info = f"Row Pattern: {inp_pattern_row}\nCol Pattern: {inp_pattern_col}"
@@ -394,28 +722,12 @@ def create_enhanced_map_visualization(ax, inp_map_string, GRID_WIDTH, BYTE_SIZE,
            bbox=dict(boxstyle='round,pad=0.5', facecolor='#e3f2fd', 
                     edgecolor='#2196f3', alpha=0.9, linewidth=1.5))
     
-    # Add search statistics (optimized for 13-inch)
-    if selected_row >= 0 and selected_col >= 0:
-        # Find the count for selected position
-        selected_count = 0
-        for key, value in counts.items():
-            pos_idx = int(key[::-1], 2)
-            if pos_idx < len(positions):
-                pos = positions[pos_idx]
-                if pos['row'] == selected_row and pos['col'] == selected_col:
-                    selected_count = value
-                    break
-        
-        total_shots = sum(counts.values())
-        prob = (selected_count / total_shots) * 100 if total_shots > 0 else 0
-        stats_info = f"Selected: ({selected_row}, {selected_col})\n"
-        stats_info += f"Count: {selected_count}/{total_shots}\n"
-        stats_info += f"Prob: {prob:.2f}%"
-        ax.text(0.98, 0.98, stats_info, transform=ax.transAxes,
-               fontsize=9, verticalalignment='top', horizontalalignment='right',
-               color='#2c3e50',
-               bbox=dict(boxstyle='round,pad=0.5', facecolor='#e8f5e9', 
-                        edgecolor='#4caf50', alpha=0.9, linewidth=1.5))
+    # Search statistics box (optimized for 13-inch)
+    stats_box = ax.text(0.98, 0.98, '', transform=ax.transAxes,
+                        fontsize=9, verticalalignment='top', horizontalalignment='right',
+                        color='#2c3e50',
+                        bbox=dict(boxstyle='round,pad=0.5', facecolor='#e8f5e9', 
+                                  edgecolor='#4caf50', alpha=0.9, linewidth=1.5))
     
     ax.set_xlabel('Column Index', fontsize=11, fontweight='bold', color='#2c3e50')
     ax.set_ylabel('Row Index', fontsize=11, fontweight='bold', color='#2c3e50')
@@ -426,33 +738,55 @@ def create_enhanced_map_visualization(ax, inp_map_string, GRID_WIDTH, BYTE_SIZE,
     ax.tick_params(colors='#2c3e50', labelsize=9)
     
     # Enhanced colorbar
-    cbar = plt.colorbar(im, ax=ax, ticks=[0, 1], shrink=0.6)
+    cbar = ax.figure.colorbar(im, ax=ax, ticks=[0, 1], shrink=0.6)
     cbar.set_label('Cell Value', fontsize=10, fontweight='bold', color='#2c3e50')
     cbar.set_ticklabels(['0', '1'])
     cbar.ax.tick_params(colors='#2c3e50', labelsize=9)
 
+    artists = {'ax': ax, 'mesh': im, 'pattern_size': (pattern_row_len, pattern_col_len),
+               'pattern_box': pattern_box, 'annotation': annotation, 'stats_box': stats_box}
+    _update_enhanced_map_visualization(artists, data, selected_row, selected_col)
+    return artists
+
+def _update_enhanced_map_visualization(artists, data, selected_row, selected_col):
+    """Move the pattern highlight and statistics to the selected position."""
+    visible = selected_row >= 0 and selected_col >= 0
+    pattern_row_len, pattern_col_len = artists['pattern_size']
+    _set_rects(artists['pattern_box'],
+               [(selected_col - pattern_row_len/2 - 0.5, selected_row - pattern_col_len/2 - 0.5,
+                 pattern_row_len, pattern_col_len)], visible)
+
+    annotation = artists['annotation']
+    annotation.xy = (selected_col, selected_row)
+    annotation.set_position((selected_col + 2, selected_row - 2))
+    annotation.set_visible(visible)
+
+    stats_box = artists['stats_box']
+    stats_box.set_visible(visible)
+    if visible:
+        # Find the count for selected position
+        selected_count = data.count_at(selected_row, selected_col)
+        
+        total_shots = data.total_shots
+        prob = (selected_count / total_shots) * 100 if total_shots > 0 else 0
+        stats_info = f"Selected: ({selected_row}, {selected_col})\n"
+        stats_info += f"Count: {selected_count}/{total_shots}\n"
+        stats_info += f"Prob: {prob:.2f}%"
+        stats_box.set_text(stats_info)
+
+def _ansi_style(color, attrs):
+    """(prefix, suffix) that colored() puts around text - empty when color is off (e.g. NO_COLOR)."""
+    prefix, _, suffix = colored("\0", color, attrs=attrs).partition("\0")
+    return prefix, suffix
+
 def show_enhanced_map(inp_map_string, GRID_WIDTH, BYTE_SIZE, selected_row=None, 
-                     selected_column=None, positions=None, counts=None):
+                     selected_column=None, positions=None, counts=None, data=None):
     """
     Enhanced version of show_map with more details and better formatting.
     """
-    ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-    BLANK = "".join([" " for each in range(BYTE_SIZE)])
-    LINE = "═"
-    
-    # Parse map - handle both string and list formats
-    if isinstance(inp_map_string, list):
-        map_clean = "".join(["".join(item) for item in inp_map_string]).replace(" ", "").replace("X", "1")
-    else:
-        map_clean = inp_map_string.replace(" ", "").replace("X", "1")
-    
-    # Calculate grid height
-    if BYTE_SIZE > 0 and GRID_WIDTH > 0:
-        GRID_HEIGHT = len([c for c in map_clean if c in "01"]) // (GRID_WIDTH * BYTE_SIZE)
-    elif GRID_WIDTH > 0:
-        GRID_HEIGHT = len([c for c in map_clean if c in "01"]) // GRID_WIDTH
-    else:
-        GRID_HEIGHT = 1
+    # Parse map - handle both string and list formats; the decoded grid (shared
+    # with the dashboard) also gives the grid height
+    grid = _map_grid(_clean_map(inp_map_string), GRID_WIDTH, BYTE_SIZE)
     
     print("\n" + "="*80)
     print(colored(" " * 25 + "QUANTUM SEARCH GRID VISUALIZATION", "cyan", attrs=['bold']))
@@ -469,45 +803,34 @@ def show_enhanced_map(inp_map_string, GRID_WIDTH, BYTE_SIZE, selected_row=None,
     print(column_items)
     print("     " + "─" * (len(column_items) - 5))
     
-    # Print rows
-    row_idx = 0
-    for each_map_line in wrap(map_clean, GRID_WIDTH * BYTE_SIZE):
-        if row_idx >= GRID_HEIGHT:
-            break
-            
-        line_items = wrap(each_map_line, BYTE_SIZE)
-        line = ""
-        
-        for col_idx, item in enumerate(line_items):
-            if row_idx == selected_row and col_idx == selected_column:
-                line = line + colored(item, "red", attrs=['bold', 'reverse']) + " "
-            elif row_idx == selected_row:
-                line = line + colored(item, "yellow", attrs=['bold']) + " "
-            elif col_idx == selected_column:
-                line = line + colored(item, "yellow", attrs=['bold']) + " "
-            else:
-                line = line + item + " "
+    # Cell styles per column, worked out once: plain cells, the selected column
+    # (yellow), and on the selected row yellow with the selected cell in red
+    plain = [("", "")] * GRID_WIDTH
+    highlight = _ansi_style("yellow", ['bold'])
+    column_styles = list(plain)
+    selected_row_styles = [highlight] * GRID_WIDTH
+    if selected_column is not None and 0 <= selected_column < GRID_WIDTH:
+        column_styles[selected_column] = highlight
+        selected_row_styles[selected_column] = _ansi_style("red", ['bold', 'reverse'])
+    
+    # Print rows, straight from the decoded grid
+    for row_idx, row in enumerate(grid.tolist()):
+        styles = selected_row_styles if row_idx == selected_row else column_styles
+        line = "".join([f"{prefix}{value:0{BYTE_SIZE}b}{suffix} "
+                        for (prefix, suffix), value in zip(styles, row)])
         
         row_label = colored(f"{row_idx:3d}", "cyan", attrs=['bold']) if row_idx == selected_row else f"{row_idx:3d}"
         print(f"{row_label} │ {line}│")
-        row_idx += 1
     
     print("     " + "─" * (len(column_items) - 5))
     
     # Add statistics if available
     if positions and counts and selected_row is not None and selected_column is not None:
-        total_shots = sum(counts.values())
-        selected_count = 0
-        selected_prob = 0
-        
-        for key, value in counts.items():
-            pos_idx = int(key[::-1], 2)
-            if pos_idx < len(positions):
-                pos = positions[pos_idx]
-                if pos['row'] == selected_row and pos['col'] == selected_column:
-                    selected_count = value
-                    selected_prob = (value / total_shots) * 100 if total_shots > 0 else 0
-                    break
+        if data is None:
+            data = prepare_panel_data(counts, positions)
+        total_shots = data.total_shots
+        selected_count = data.count_at(selected_row, selected_column)
+        selected_prob = (selected_count / total_shots) * 100 if total_shots > 0 else 0
         
         print("\n" + colored("Search Statistics:", "green", attrs=['bold']))
         print(f"  • Selected Position: ({selected_row}, {selected_column})")
@@ -517,118 +840,99 @@ def show_enhanced_map(inp_map_string, GRID_WIDTH, BYTE_SIZE, selected_row=None,
     
     print("="*80 + "\n")
 
+# Summary report rules and section headers, built once
+_RULE = "=" * 80
+_SECTION_RULE = "-" * 80
+_REPORT_TITLE = " " * 20 + "QUANTUM SEARCH ALGORITHM - SUMMARY REPORT"
+_HDR_SEARCH_CONFIG = colored("SEARCH CONFIGURATION", "cyan", attrs=['bold'])
+_HDR_CIRCUIT_INFO = colored("CIRCUIT INFORMATION", "cyan", attrs=['bold'])
+_HDR_SEARCH_SPACE = colored("SEARCH SPACE ANALYSIS", "cyan", attrs=['bold'])
+_HDR_RESULTS = colored("RESULTS ANALYSIS", "cyan", attrs=['bold'])
+_HDR_SUCCESS_METRICS = colored("SUCCESS METRICS", "cyan", attrs=['bold'])
+_HDR_SELECTED_POSITION = colored("SELECTED POSITION", "green", attrs=['bold'])
+
 def generate_summary_report(counts, positions, qc, num_repetitions, selected_row, 
                            selected_col, inp_pattern_row, inp_pattern_col, 
-                           backend_name, total_shots):
+                           backend_name, total_shots, data=None):
     """
     Generate a comprehensive text summary report of the search results.
     """
-    report = []
-    report.append("="*80)
-    report.append(" " * 20 + "QUANTUM SEARCH ALGORITHM - SUMMARY REPORT")
-    report.append("="*80)
-    report.append("")
+    if data is None:
+        data = prepare_panel_data(counts, positions)
+    report = io.StringIO()
+    w = report.write
+    w(f"{_RULE}\n{_REPORT_TITLE}\n{_RULE}\n\n")
     
     # Search Configuration
-    report.append(colored("SEARCH CONFIGURATION", "cyan", attrs=['bold']))
-    report.append("-" * 80)
-    report.append(f"  Backend: {backend_name}")
-    report.append(f"  Row Pattern: {inp_pattern_row}")
-    report.append(f"  Column Pattern: {inp_pattern_col}")
-    report.append(f"  Grover Iterations: {num_repetitions}")
-    report.append(f"  Total Shots: {total_shots}")
-    report.append("")
+    w(f"{_HDR_SEARCH_CONFIG}\n{_SECTION_RULE}\n")
+    w(f"  Backend: {backend_name}\n")
+    w(f"  Row Pattern: {inp_pattern_row}\n")
+    w(f"  Column Pattern: {inp_pattern_col}\n")
+    w(f"  Grover Iterations: {num_repetitions}\n")
+    w(f"  Total Shots: {total_shots}\n\n")
     
     # Circuit Information
-    report.append(colored("CIRCUIT INFORMATION", "cyan", attrs=['bold']))
-    report.append("-" * 80)
-    report.append(f"  Total Qubits: {qc.num_qubits}")
-    report.append(f"  Circuit Depth: {qc.depth()}")
-    report.append(f"  Circuit Size: {qc.size()}")
-    report.append("")
+    w(f"{_HDR_CIRCUIT_INFO}\n{_SECTION_RULE}\n")
+    w(f"  Total Qubits: {qc.num_qubits}\n")
+    w(f"  Circuit Depth: {qc.depth()}\n")
+    w(f"  Circuit Size: {qc.size()}\n\n")
     
     # Search Space
-    report.append(colored("SEARCH SPACE ANALYSIS", "cyan", attrs=['bold']))
-    report.append("-" * 80)
-    report.append(f"  Total Search Positions: {len(positions)}")
-    report.append(f"  Search Space Size (N): {len(positions)}")
-    report.append(f"  Expected Solutions (M): 1")
-    report.append(f"  Optimal Iterations: {math.ceil((math.pi/4) * math.sqrt(len(positions)))}")
-    report.append(f"  Actual Iterations: {num_repetitions}")
-    report.append("")
+    w(f"{_HDR_SEARCH_SPACE}\n{_SECTION_RULE}\n")
+    w(f"  Total Search Positions: {len(positions)}\n")
+    w(f"  Search Space Size (N): {len(positions)}\n")
+    w(f"  Expected Solutions (M): 1\n")
+    w(f"  Optimal Iterations: {math.ceil((math.pi/4) * math.sqrt(len(positions)))}\n")
+    w(f"  Actual Iterations: {num_repetitions}\n\n")
     
     # Results Analysis
-    report.append(colored("RESULTS ANALYSIS", "cyan", attrs=['bold']))
-    report.append("-" * 80)
-    
-    sorted_results = sorted(counts.items(), key=lambda x: x[1], reverse=True)
-    top_result = sorted_results[0]
-    top_pos_idx = int(top_result[0][::-1], 2)
-    
-    if top_pos_idx < len(positions):
-        top_pos = positions[top_pos_idx]
-        top_prob = (top_result[1] / total_shots) * 100
-        report.append(f"  Top Result: Position ({top_pos['row']}, {top_pos['col']})")
-        report.append(f"    - Count: {top_result[1]} / {total_shots}")
-        report.append(f"    - Probability: {top_prob:.2f}%")
-        report.append(f"    - Binary Index: {top_result[0]}")
-        report.append("")
+    w(f"{_HDR_RESULTS}\n{_SECTION_RULE}\n")
+    
+    top_5 = data.top(5).tolist()
+    top = top_5[0]
+    
+    if data.row_idx[top] >= 0:
+        top_prob = (data.counts[top] / total_shots) * 100
+        w(f"  Top Result: Position ({data.row_idx[top]}, {data.col_idx[top]})\n")
+        w(f"    - Count: {data.counts[top]} / {total_shots}\n")
+        w(f"    - Probability: {top_prob:.2f}%\n")
+        w(f"    - Binary Index: {data.keys[top]}\n\n")
     
     # Top 5 Results
-    report.append("  Top 5 Results:")
-    for i, (key, value) in enumerate(sorted_results[:5], 1):
-        pos_idx = int(key[::-1], 2)
-        if pos_idx < len(positions):
-            pos = positions[pos_idx]
-            prob = (value / total_shots) * 100
-            report.append(f"    {i}. Position ({pos['row']}, {pos['col']}): "
-                         f"{value} counts ({prob:.2f}%)")
+    w("  Top 5 Results:\n")
+    for rank, i in enumerate(top_5, 1):
+        if data.row_idx[i] >= 0:
+            prob = (data.counts[i] / total_shots) * 100
+            w(f"    {rank}. Position ({data.row_idx[i]}, {data.col_idx[i]}): "
+              f"{data.counts[i]} counts ({prob:.2f}%)\n")
     
-    report.append("")
+    w("\n")
     
     # Success Metrics
-    report.append(colored("SUCCESS METRICS", "cyan", attrs=['bold']))
-    report.append("-" * 80)
-    top_prob = (sorted_results[0][1] / total_shots) * 100
-    top3_prob = sum([v for k, v in sorted_results[:3]]) / total_shots * 100
-    
-    report.append(f"  Top Result Confidence: {top_prob:.2f}%")
-    report.append(f"  Top 3 Combined: {top3_prob:.2f}%")
-    report.append(f"  Unique Results: {len(counts)}")
+    w(f"{_HDR_SUCCESS_METRICS}\n{_SECTION_RULE}\n")
+    top_prob = (data.counts[top] / total_shots) * 100
+    top3_prob = data.counts[data.top(3)].sum() / total_shots * 100
     
-    # Calculate entropy
-    probabilities = [v/total_shots for v in counts.values()]
-    entropy = -sum([p * math.log2(p) if p > 0 else 0 for p in probabilities])
-    max_entropy = math.log2(len(counts))
-    normalized_entropy = (entropy / max_entropy) * 100 if max_entropy > 0 else 0
+    w(f"  Top Result Confidence: {top_prob:.2f}%\n")
+    w(f"  Top 3 Combined: {top3_prob:.2f}%\n")
+    w(f"  Unique Results: {len(data.keys)}\n")
     
-    report.append(f"  Result Entropy: {entropy:.3f} bits (Normalized: {normalized_entropy:.1f}%)")
-    report.append("")
+    w(f"  Result Entropy: {data.entropy:.3f} bits (Normalized: {data.normalized_entropy:.1f}%)\n\n")
     
     # Selected Position (if found)
     if selected_row >= 0 and selected_col >= 0:
-        report.append(colored("SELECTED POSITION", "green", attrs=['bold']))
-        report.append("-" * 80)
-        report.append(f"  Row: {selected_row}")
-        report.append(f"  Column: {selected_col}")
+        w(f"{_HDR_SELECTED_POSITION}\n{_SECTION_RULE}\n")
+        w(f"  Row: {selected_row}\n")
+        w(f"  Column: {selected_col}\n")
         
         # Find count for selected position
-        selected_count = 0
-        for key, value in counts.items():
-            pos_idx = int(key[::-1], 2)
-            if pos_idx < len(positions):
-                pos = positions[pos_idx]
-                if pos['row'] == selected_row and pos['col'] == selected_col:
-                    selected_count = value
-                    break
+        selected_count = data.count_at(selected_row, selected_col)
         
         selected_prob = (selected_count / total_shots) * 100 if total_shots > 0 else 0
-        report.append(f"  Measurement Count: {selected_count} / {total_shots}")
-        report.append(f"  Probability: {selected_prob:.2f}%")
-        report.append("")
+        w(f"  Measurement Count: {selected_count} / {total_shots}\n")
+        w(f"  Probability: {selected_prob:.2f}%\n\n")
     
-    report.append("="*80)
-    report.append("")
+    w(f"{_RULE}\n")
     
-    return "\n".join(report)
+    return report.getvalue()
 